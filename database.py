@@ -6,12 +6,16 @@ Import and use these functions in your API endpoints for database operations.
 """
 
 from pymongo import MongoClient
+from pymongo.errors import ServerSelectionTimeoutError
 from datetime import datetime, timezone
+import logging
 import os
 from dotenv import load_dotenv
-from typing import Union
+from typing import List, Optional, Tuple, Union
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -22,7 +26,16 @@ database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
 if database_url and database_name:
-    _client = MongoClient(database_url)
+    # Fail fast when Mongo is degraded instead of stalling workers on the 30s driver defaults
+    _client = MongoClient(
+        database_url,
+        serverSelectionTimeoutMS=1500,
+        connectTimeoutMS=1500,
+        socketTimeoutMS=2000,
+        maxPoolSize=50,
+        minPoolSize=5,
+        waitQueueTimeoutMS=1000,
+    )
     db = _client[database_name]
 
 # Helper functions for common database operations
@@ -43,13 +56,59 @@ def create_document(collection_name: str, data: Union[BaseModel, dict]):
     result = db[collection_name].insert_one(data_dict)
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
-    """Get documents from collection"""
+def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None, projection: dict = None,
+                  sort: Optional[List[Tuple[str, int]]] = None):
+    """Get documents from collection, optionally restricted to the fields in projection"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
     
-    cursor = db[collection_name].find(filter_dict or {})
+    cursor = db[collection_name].find(filter_dict or {}, projection)
+    if sort:
+        cursor = cursor.sort(sort)
     if limit:
         cursor = cursor.limit(limit)
     
     return list(cursor)
+
+def get_documents_projected(collection_name: str, projection: dict, filter_dict: dict = None, limit: int = None,
+                            sort: Optional[List[Tuple[str, int]]] = None):
+    """Get documents shaped for JSON: projected fields plus a string "id" in place of "_id" """
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    pipeline = []
+    if filter_dict:
+        pipeline.append({"$match": filter_dict})
+    if sort:
+        pipeline.append({"$sort": dict(sort)})
+    if limit:
+        pipeline.append({"$limit": limit})
+    pipeline.append({"$project": {"_id": 0, "id": {"$toString": "$_id"}, **projection}})
+
+    return list(db[collection_name].aggregate(pipeline))
+
+# Indexes backing the content list endpoints: sort keys plus a unique slug per collection
+CONTENT_INDEXES = [
+    ("service", [("featured", -1), ("title", 1)], False),
+    ("blogpost", [("date", -1)], False),
+    ("service", [("slug", 1)], True),
+    ("project", [("slug", 1)], True),
+    ("blogpost", [("slug", 1)], True),
+]
+
+def ensure_indexes():
+    """Create content indexes if missing; logs indexes that fail (e.g. duplicate slugs), stops if Mongo is unreachable"""
+    if db is None:
+        return
+    # Index builds can outlast the request-path socketTimeoutMS, so they run on a short-lived client without one
+    with MongoClient(database_url, serverSelectionTimeoutMS=1500, connectTimeoutMS=1500) as admin_client:
+        admin_db = admin_client[database_name]
+        for collection_name, keys, unique in CONTENT_INDEXES:
+            try:
+                admin_db[collection_name].create_index(keys, unique=unique)
+            except ServerSelectionTimeoutError as e:
+                logger.warning("Skipping index creation, MongoDB unreachable: %s", e)
+                return
+            except Exception as e:
+                logger.error("Could not create %sindex %s on %s: %s",
+                             "unique " if unique else "", keys, collection_name, e)
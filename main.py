@@ -1,22 +1,48 @@
+import asyncio
+import hashlib
 import os
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from bson import ObjectId
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
 
-from database import create_document, get_documents, db
-from schemas import Service, Project, BlogPost, NewsletterSubscriber, ContactMessage, Testimonial
+from database import create_document, ensure_indexes, get_documents_projected, db
+from schemas import (
+    NewsletterSubscriber, ContactMessage,
+    SERVICE_LIST_ADAPTER, PROJECT_LIST_ADAPTER, BLOGPOST_LIST_ADAPTER, TESTIMONIAL_LIST_ADAPTER,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # create_index blocks on Mongo; keep it off the event loop.
+    await run_in_threadpool(ensure_indexes)
+    yield
 
-app = FastAPI(title="NEXORA SYNERGY API")
+
+app = FastAPI(title="NEXORA SYNERGY API", default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Explicit origins (comma-separated CORS_ORIGINS overrides the default); "*" with credentials is invalid per spec.
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "https://nexorasynergy.com,https://www.nexorasynergy.com").split(",")
+    if origin.strip()
+)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST"),
+    allow_headers=("Content-Type",),
 )
 
 
@@ -30,8 +56,28 @@ def hello():
     return {"message": "Hello from the NEXORA SYNERGY backend!"}
 
 
+# Environment and DB identity are fixed for the life of the process.
+_DB_URL_SET = bool(os.getenv("DATABASE_URL"))
+_DB_NAME = getattr(db, "name", None)
+
+# /test is polled by health checks; don't hit Mongo for the collection list on every call.
+COLLECTIONS_TTL = 30.0
+_collections_cache: Optional[Tuple[float, List[str]]] = None
+
+
+async def _collection_names() -> List[str]:
+    """First 10 collection names, memoized for COLLECTIONS_TTL seconds"""
+    global _collections_cache
+    now = time.monotonic()
+    if _collections_cache is not None and now - _collections_cache[0] < COLLECTIONS_TTL:
+        return _collections_cache[1]
+    names = (await run_in_threadpool(db.list_collection_names))[:10]
+    _collections_cache = (now, names)
+    return names
+
+
 @app.get("/test")
-def test_database():
+async def test_database():
     """Test endpoint to check if database is available and accessible"""
     response = {
         "backend": "✅ Running",
@@ -45,12 +91,11 @@ def test_database():
     try:
         if db is not None:
             response["database"] = "✅ Available"
-            response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
-            response["database_name"] = getattr(db, "name", None) or "❌ Unknown"
+            response["database_url"] = "✅ Set" if _DB_URL_SET else "❌ Not Set"
+            response["database_name"] = _DB_NAME or "❌ Unknown"
             response["connection_status"] = "Connected"
             try:
-                collections = db.list_collection_names()
-                response["collections"] = collections[:10]
+                response["collections"] = await _collection_names()
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
                 response["database"] = f"⚠️  Connected but Error: {str(e)[:80]}"
@@ -65,87 +110,201 @@ def test_database():
 # -------- Content Endpoints --------
 
 # Seed defaults (used if DB empty). These are also used for initial frontend rendering.
-DEFAULT_SERVICES: List[Service] = [
-    Service(icon="Code", title="Software & Web Development", slug="software-web-development",
-            summary="Custom applications, modern web platforms, and scalable architectures.", featured=True),
-    Service(icon="Shield", title="Cybersecurity & Network Solutions", slug="cybersecurity-network",
-            summary="Proactive defense, audits, and zero-trust strategies for resilient systems."),
-    Service(icon="GitBranch", title="Digital Transformation & IT Consultancy", slug="digital-transformation",
-            summary="Roadmaps, process automation, and change management for enterprise evolution."),
-    Service(icon="Cloud", title="Cloud Services", slug="cloud-services",
-            summary="Cloud-native design, infrastructure as code, and cost optimization."),
-    Service(icon="LineChart", title="Data & Analytics", slug="data-analytics",
-            summary="Dashboards, ML pipelines, and insights that move the business."),
-]
-
-DEFAULT_PROJECTS: List[Project] = [
-    Project(title="Nebula Commerce Platform", slug="nebula-commerce",
-            summary="Composable eCommerce with sub-second TTFB and 99.99% uptime.", tags=["Next.js", "Edge", "MongoDB"]),
-    Project(title="Aegis SOC Automation", slug="aegis-soc",
-            summary="SOAR workflows cutting incident response time by 68%.", tags=["Python", "SIEM", "Playbooks"]),
-    Project(title="Stratus Cloud Migration", slug="stratus-migration",
-            summary="Multi-cloud migration with 32% cost reduction.", tags=["Kubernetes", "IaC", "GCP/AWS"]),
-]
-
-DEFAULT_POSTS: List[BlogPost] = [
-    BlogPost(title="Designing for Velocity and Safety", slug="velocity-and-safety", author="NEXORA Team",
-             date=datetime.utcnow(), tags=["Architecture", "DX"],
-             excerpt="How we deliver fast without compromising security.",
-             content="We balance platform engineering, guardrails, and automation to ship safely."),
-]
+DEFAULT_SERVICES: Tuple[dict, ...] = (
+    {"icon": "Code", "title": "Software & Web Development", "slug": "software-web-development",
+     "summary": "Custom applications, modern web platforms, and scalable architectures.", "featured": True},
+    {"icon": "Shield", "title": "Cybersecurity & Network Solutions", "slug": "cybersecurity-network",
+     "summary": "Proactive defense, audits, and zero-trust strategies for resilient systems."},
+    {"icon": "GitBranch", "title": "Digital Transformation & IT Consultancy", "slug": "digital-transformation",
+     "summary": "Roadmaps, process automation, and change management for enterprise evolution."},
+    {"icon": "Cloud", "title": "Cloud Services", "slug": "cloud-services",
+     "summary": "Cloud-native design, infrastructure as code, and cost optimization."},
+    {"icon": "LineChart", "title": "Data & Analytics", "slug": "data-analytics",
+     "summary": "Dashboards, ML pipelines, and insights that move the business."},
+)
+
+DEFAULT_PROJECTS: Tuple[dict, ...] = (
+    {"title": "Nebula Commerce Platform", "slug": "nebula-commerce",
+     "summary": "Composable eCommerce with sub-second TTFB and 99.99% uptime.", "tags": ["Next.js", "Edge", "MongoDB"]},
+    {"title": "Aegis SOC Automation", "slug": "aegis-soc",
+     "summary": "SOAR workflows cutting incident response time by 68%.", "tags": ["Python", "SIEM", "Playbooks"]},
+    {"title": "Stratus Cloud Migration", "slug": "stratus-migration",
+     "summary": "Multi-cloud migration with 32% cost reduction.", "tags": ["Kubernetes", "IaC", "GCP/AWS"]},
+)
+
+DEFAULT_POSTS: Tuple[dict, ...] = (
+    {"title": "Designing for Velocity and Safety", "slug": "velocity-and-safety", "author": "NEXORA Team",
+     "date": datetime(2024, 1, 1), "tags": ["Architecture", "DX"],
+     "excerpt": "How we deliver fast without compromising security.",
+     "content": "We balance platform engineering, guardrails, and automation to ship safely."},
+)
+
+DEFAULT_TESTIMONIALS: Tuple[dict, ...] = (
+    {"name": "A. Rivera", "role": "CTO", "company": "Orbit Labs",
+     "quote": "NEXORA accelerated our roadmap and hardened our security posture."},
+    {"name": "M. Chen", "role": "Head of Data", "company": "QuantumX",
+     "quote": "From pipeline reliability to dashboards, they delivered."},
+)
+
+
+# Fields returned by each listing, from Mongo and from the seed fallback alike. /api/blog is the
+# only way to read posts, so it keeps the post body.
+SERVICE_LIST_PROJ = {"icon": 1, "title": 1, "slug": 1, "summary": 1, "featured": 1}
+PROJECT_LIST_PROJ = {"title": 1, "slug": 1, "summary": 1, "tags": 1}
+BLOGPOST_LIST_PROJ = {"title": 1, "slug": 1, "author": 1, "date": 1, "tags": 1, "excerpt": 1, "coverImage": 1,
+                      "content": 1}
+TESTIMONIAL_LIST_PROJ = {"name": 1, "role": 1, "company": 1, "quote": 1, "avatar": 1}
+
+# List ordering, applied to the seed fallback too; each sort is backed by an index from database.ensure_indexes.
+SERVICE_LIST_SORT = [("featured", -1), ("title", 1)]
+BLOGPOST_LIST_SORT = [("date", -1)]
+
+
+def _encode_fallback(adapter: TypeAdapter, items: Tuple[dict, ...], projection: dict,
+                     sort: Optional[List[Tuple[str, int]]] = None) -> bytes:
+    """Validate seed dicts against their schema and encode the projected fields, in sort order, as a list payload"""
+    models = adapter.validate_python(items)
+    # Stable sorts from the last key to the first reproduce Mongo's multi-key ordering.
+    for field, direction in reversed(sort or []):
+        models.sort(key=lambda m: getattr(m, field), reverse=direction < 0)
+    fields = {"__all__": set(projection)}
+    return b'{"items":' + adapter.dump_json(models, include=fields) + b'}'
+
+
+# Fallback payloads are validated and encoded once at import, so schema drift fails at startup
+# and the seed data never goes through pydantic at request time.
+_SERVICES_FALLBACK_BYTES = _encode_fallback(SERVICE_LIST_ADAPTER, DEFAULT_SERVICES, SERVICE_LIST_PROJ, SERVICE_LIST_SORT)
+_PROJECTS_FALLBACK_BYTES = _encode_fallback(PROJECT_LIST_ADAPTER, DEFAULT_PROJECTS, PROJECT_LIST_PROJ)
+_POSTS_FALLBACK_BYTES = _encode_fallback(BLOGPOST_LIST_ADAPTER, DEFAULT_POSTS, BLOGPOST_LIST_PROJ, BLOGPOST_LIST_SORT)
+_TESTIMONIALS_FALLBACK_BYTES = _encode_fallback(TESTIMONIAL_LIST_ADAPTER, DEFAULT_TESTIMONIALS, TESTIMONIAL_LIST_PROJ)
 
 
 class ListResponse(BaseModel):
     items: list
 
 
-@app.get("/api/content/services", response_model=ListResponse)
-async def list_services():
+# Documents the list shape in OpenAPI without re-validating the outgoing payload.
+LIST_RESPONSES = {200: {"model": ListResponse}}
+
+# Content changes rarely, so encoded list payloads are reused for CONTENT_TTL seconds. A fallback
+# served because Mongo errored is only kept for CONTENT_ERROR_TTL so real content returns quickly.
+CONTENT_TTL = 60.0
+CONTENT_ERROR_TTL = 5.0
+# key -> (expires_at, payload, etag)
+_cache: Dict[str, Tuple[float, bytes, str]] = {}
+_cache_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _etag(payload: bytes) -> str:
+    """Strong ETag for an encoded payload"""
+    return '"%s"' % hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match check using weak comparison (RFC 9110 13.1.2): "*" matches, W/ prefixes are ignored"""
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def _json_response(request: Request, payload: bytes, etag: str) -> Response:
+    """Send payload with its ETag, or an empty 304 if the client already holds it"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+
+
+async def cached_json(request: Request, key: str, ttl: float, builder: Callable[[], Tuple[bytes, bool]]) -> Response:
+    """Return the JSON bytes cached under key, rebuilding them once they expire.
+
+    builder returns (payload, ok); payloads built with ok=False are cached for CONTENT_ERROR_TTL only.
+    """
+    hit = _cache.get(key)
+    if hit is None or time.monotonic() >= hit[0]:
+        # One rebuild per key at a time; concurrent misses wait and reuse its result.
+        async with _cache_locks.setdefault(key, asyncio.Lock()):
+            hit = _cache.get(key)
+            if hit is None or time.monotonic() >= hit[0]:
+                # builder does blocking PyMongo I/O; keep it off the event loop.
+                payload, ok = await run_in_threadpool(builder)
+                expires_at = time.monotonic() + (ttl if ok else CONTENT_ERROR_TTL)
+                hit = (expires_at, payload, _etag(payload))
+                _cache[key] = hit
+    return _json_response(request, hit[1], hit[2])
+
+
+def _orjson_default(o):
+    """Encode nested ObjectIds as str; any other unsupported type raises so the listing falls back"""
+    if isinstance(o, ObjectId):
+        return str(o)
+    raise TypeError(f"Type is not JSON serializable: {type(o).__name__}")
+
+
+def _list_payload(collection_name: str, projection: dict, fallback: bytes,
+                  sort: Optional[List[Tuple[str, int]]] = None) -> Tuple[bytes, bool]:
+    """Encode a collection listing as (payload, ok).
+
+    An empty collection gives the seed fallback with ok=True; a DB error gives the fallback with ok=False.
+    """
     try:
-        docs = get_documents("service")
+        docs = get_documents_projected(collection_name, projection, sort=sort)
         if docs:
-            # convert ObjectId
-            for d in docs:
-                d["id"] = str(d.get("_id"))
-                d.pop("_id", None)
-            return {"items": docs}
+            return orjson.dumps({"items": docs}, default=_orjson_default), True
     except Exception:
-        pass
-    return {"items": [s.model_dump() for s in DEFAULT_SERVICES]}
+        return fallback, False
+    return fallback, True
 
 
-@app.get("/api/content/projects", response_model=ListResponse)
-async def list_projects():
-    try:
-        docs = get_documents("project")
-        if docs:
-            for d in docs:
-                d["id"] = str(d.get("_id"))
-                d.pop("_id", None)
-            return {"items": docs}
-    except Exception:
-        pass
-    return {"items": [p.model_dump() for p in DEFAULT_PROJECTS]}
+def make_list_endpoint(collection_name: str, projection: dict, fallback: bytes, ttl: float,
+                       sort: Optional[List[Tuple[str, int]]] = None):
+    """Build a GET handler serving a cached, projected listing of collection_name"""
+    def builder() -> Tuple[bytes, bool]:
+        return _list_payload(collection_name, projection, fallback, sort)
 
+    fallback_etag = _etag(fallback)
 
-@app.get("/api/blog", response_model=ListResponse)
-async def list_blog_posts():
-    try:
-        docs = get_documents("blogpost")
-        if docs:
-            for d in docs:
-                d["id"] = str(d.get("_id"))
-                d.pop("_id", None)
-            return {"items": docs}
-    except Exception:
-        pass
-    return {"items": [p.model_dump() for p in DEFAULT_POSTS]}
+    async def handler(request: Request) -> Response:
+        if db is None:
+            # No database configured: serve the import-time bytes without a cache or threadpool hop.
+            return _json_response(request, fallback, fallback_etag)
+        return await cached_json(request, collection_name, ttl, builder)
+
+    return handler
+
+
+app.add_api_route(
+    "/api/content/services",
+    make_list_endpoint("service", SERVICE_LIST_PROJ, _SERVICES_FALLBACK_BYTES, CONTENT_TTL, sort=SERVICE_LIST_SORT),
+    methods=["GET"], name="list_services", responses=LIST_RESPONSES,
+)
+app.add_api_route(
+    "/api/content/projects",
+    make_list_endpoint("project", PROJECT_LIST_PROJ, _PROJECTS_FALLBACK_BYTES, CONTENT_TTL),
+    methods=["GET"], name="list_projects", responses=LIST_RESPONSES,
+)
+app.add_api_route(
+    "/api/blog",
+    make_list_endpoint("blogpost", BLOGPOST_LIST_PROJ, _POSTS_FALLBACK_BYTES, CONTENT_TTL, sort=BLOGPOST_LIST_SORT),
+    methods=["GET"], name="list_blog_posts", responses=LIST_RESPONSES,
+)
+app.add_api_route(
+    "/api/testimonials",
+    make_list_endpoint("testimonial", TESTIMONIAL_LIST_PROJ, _TESTIMONIALS_FALLBACK_BYTES, CONTENT_TTL),
+    methods=["GET"], name="list_testimonials", responses=LIST_RESPONSES,
+)
 
 
 @app.post("/api/contact")
 async def create_contact(msg: ContactMessage):
     try:
-        doc_id = create_document("contactmessage", msg)
+        doc_id = await run_in_threadpool(create_document, "contactmessage", msg)
         return {"ok": True, "id": doc_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -154,33 +313,12 @@ async def create_contact(msg: ContactMessage):
 @app.post("/api/newsletter")
 async def subscribe(payload: NewsletterSubscriber):
     try:
-        doc_id = create_document("newslettersubscriber", payload)
+        doc_id = await run_in_threadpool(create_document, "newslettersubscriber", payload)
         return {"ok": True, "id": doc_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/testimonials", response_model=ListResponse)
-async def list_testimonials():
-    try:
-        docs = get_documents("testimonial")
-        if docs:
-            for d in docs:
-                d["id"] = str(d.get("_id"))
-                d.pop("_id", None)
-            return {"items": docs}
-    except Exception:
-        pass
-    # Fallback sample
-    sample = [
-        Testimonial(name="A. Rivera", role="CTO", company="Orbit Labs",
-                    quote="NEXORA accelerated our roadmap and hardened our security posture.").model_dump(),
-        Testimonial(name="M. Chen", role="Head of Data", company="QuantumX",
-                    quote="From pipeline reliability to dashboards, they delivered.").model_dump(),
-    ]
-    return {"items": sample}
-
-
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
@@ -11,19 +11,34 @@ Model name is converted to lowercase for the collection name:
 - BlogPost -> "blogpost" collection
 """
 
-from pydantic import BaseModel, Field, EmailStr, HttpUrl
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
+from typing import Annotated, Optional, List
 from datetime import datetime
 
+# Shared model config: instances are immutable once validated and string fields are trimmed
+_CFG = ConfigDict(frozen=True, str_strip_whitespace=True)
+
+# Email address checked by a simple pattern (compiled once in pydantic-core) instead of email-validator
+Email = Annotated[str, StringConstraints(
+    pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254, strip_whitespace=True, to_lower=True,
+)]
+
+# Display-only http(s) URL kept as a plain str; avoids building and normalizing a pydantic Url object
+WebUrl = Annotated[str, StringConstraints(pattern=r"^https?://", max_length=2048)]
+
 # Core examples
 class User(BaseModel):
+    model_config = _CFG
+
     name: str = Field(..., description="Full name")
-    email: EmailStr = Field(..., description="Email address")
+    email: Email = Field(..., description="Email address")
     address: Optional[str] = Field(None, description="Address")
     age: Optional[int] = Field(None, ge=0, le=120, description="Age in years")
     is_active: bool = Field(True, description="Whether user is active")
 
 class Product(BaseModel):
+    model_config = _CFG
+
     title: str = Field(..., description="Product title")
     description: Optional[str] = Field(None, description="Product description")
     price: float = Field(..., ge=0, description="Price in dollars")
@@ -32,6 +47,8 @@ class Product(BaseModel):
 
 # NEXORA SYNERGY content models
 class Service(BaseModel):
+    model_config = _CFG
+
     icon: str = Field(..., description="Icon name (e.g., 'Code', 'Shield')")
     title: str
     slug: str
@@ -40,36 +57,52 @@ class Service(BaseModel):
     featured: bool = False
 
 class Project(BaseModel):
+    model_config = _CFG
+
     title: str
     slug: str
     summary: str
     content: Optional[str] = None
-    images: Optional[List[HttpUrl]] = None
+    images: Optional[List[WebUrl]] = None
     tags: Optional[List[str]] = None
     metrics: Optional[dict] = None
 
 class BlogPost(BaseModel):
+    model_config = _CFG
+
     title: str
     slug: str
     author: str
     date: datetime
     tags: Optional[List[str]] = None
     excerpt: Optional[str] = None
-    coverImage: Optional[HttpUrl] = None
+    coverImage: Optional[WebUrl] = None
     content: str
 
 class Testimonial(BaseModel):
+    model_config = _CFG
+
     name: str
     role: Optional[str] = None
     company: Optional[str] = None
     quote: str
-    avatar: Optional[HttpUrl] = None
+    avatar: Optional[WebUrl] = None
 
 class NewsletterSubscriber(BaseModel):
-    email: EmailStr
+    model_config = _CFG
+
+    email: Email
 
 class ContactMessage(BaseModel):
+    model_config = _CFG
+
     name: str
-    email: EmailStr
+    email: Email
     phone: Optional[str] = None
     message: str
+
+# List adapters are built once here; constructing a TypeAdapter per call rebuilds its validator.
+SERVICE_LIST_ADAPTER = TypeAdapter(List[Service])
+PROJECT_LIST_ADAPTER = TypeAdapter(List[Project])
+BLOGPOST_LIST_ADAPTER = TypeAdapter(List[BlogPost])
+TESTIMONIAL_LIST_ADAPTER = TypeAdapter(List[Testimonial])